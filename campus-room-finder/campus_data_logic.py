@@ -7,17 +7,111 @@ for the campus room finder application. It's separated from the UI to maintain
 clean architecture and enable easier testing and maintenance.
 """
 
+import copy
 import json
-import csv
+import math
 import re
+import sqlite3
+import hashlib
+import threading
+import time
 import requests
-from typing import List, Tuple, Optional, Dict, Any
+import numpy as np
+from typing import List, Tuple, Optional, Dict, Any, Set, Sequence
 from pathlib import Path
-from dataclasses import dataclass
-from rapidfuzz import process
+from dataclasses import dataclass, field
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+from rapidfuzz import process, fuzz, utils
 
+try:
+    import orjson
+except ImportError:  # optional faster JSON parser; fall back to stdlib json
+    orjson = None
 
-@dataclass
+try:
+    import ijson
+except ImportError:  # optional streaming parser for very large rooms files
+    ijson = None
+
+try:
+    from numba import njit
+except ImportError:  # optional JIT; the NumPy point-in-polygon kernel is used instead
+    njit = None
+
+
+# WKT coordinate patterns, compiled once for the boundary loader
+_WKT_POINT_RE = re.compile(r"POINT\s*\(\s*(-?\d+\.\d+)\s+(-?\d+\.\d+)\s*\)", re.IGNORECASE)
+_WKT_ANY_RE = re.compile(r"(-?\d+\.\d+)[,\s]+(-?\d+\.\d+)")
+
+# Boundary CSV coordinate columns, in order of preference
+_WKT_COLUMNS = ("WKT", "wkt")
+_LAT_COLUMNS = ("lat", "latitude", "y")
+_LON_COLUMNS = ("lon", "longitude", "x")
+_COORDINATE_COLUMNS = frozenset(_WKT_COLUMNS + _LAT_COLUMNS + _LON_COLUMNS)
+
+# rooms.json files at least this large are stream-parsed when ijson is available
+_STREAM_PARSE_MIN_BYTES = 1_000_000
+
+# Parser errors load_rooms treats as a bad rooms file
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
+
+# Mean Earth radius, for great-circle distances
+_EARTH_RADIUS_KM = 6371.0088
+
+# Cells per axis of the AccessController lookup grid
+_GRID_SIZE = 64
+
+
+class _NoReadTimeoutRetry(Retry):
+    """Retry policy that gives up at once on a read timeout."""
+
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None):
+        # A server that accepted the request but never answered will most
+        # likely hang again; other read errors (reset or dropped keep-alive
+        # connections) still go through the normal retry accounting
+        if isinstance(error, ReadTimeoutError):
+            raise error
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+# Shared HTTP session so routing requests reuse pooled keep-alive connections;
+# dropped or reset connections and gateway errors from the public OSRM server
+# are retried on the pool instead of failing the route. Read timeouts are not
+# retried, so a hung server costs one timeout rather than three
+_RETRY = _NoReadTimeoutRetry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_RETRY))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_RETRY))
+
+
+def _pip_kernel(x: float, y: float, xs: np.ndarray, ys: np.ndarray) -> bool:
+    """Scalar ray-casting loop over contiguous vertex arrays, compiled by Numba if available."""
+    inside = False
+    n = xs.shape[0]
+    j = n - 1
+    for i in range(n):
+        xi, yi = xs[i], ys[i]
+        xj, yj = xs[j], ys[j]
+        if (yi > y) != (yj > y):
+            # x < xi + (xj - xi) * (y - yi) / (yj - yi), multiplied through by
+            # (yj - yi) so no division is needed; for a crossing edge the
+            # multiplier is positive exactly when yj is the upper end
+            cross = (x - xi) * (yj - yi) - (xj - xi) * (y - yi)
+            if (cross < 0.0) == (yj > y):
+                inside = not inside
+        j = i
+    return inside
+
+
+_pip_numba = njit(cache=True, fastmath=True)(_pip_kernel) if njit is not None else None
+
+
+@dataclass(slots=True, frozen=True)
 class Room:
     """Data model representing a campus room with all its properties."""
     room_name: str
@@ -26,12 +120,28 @@ class Room:
     lat: Optional[float]
     lon: Optional[float]
     
-    def __post_init__(self):
-        """Ensure floor is always a string and handle None values."""
-        if self.floor is None:
-            self.floor = ""
-        else:
-            self.floor = str(self.floor)
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Room":
+        """
+        Build a Room from a raw rooms.json record.
+        
+        The floor is normalized to a string here (None becomes "") so the
+        instance itself needs no post-init processing.
+        
+        Args:
+            data: Dictionary with room_name, building, floor, lat and lon keys
+            
+        Returns:
+            Room object
+        """
+        floor = data.get("floor")
+        return cls(
+            room_name=data.get("room_name", ""),
+            building=data.get("building", ""),
+            floor="" if floor is None else str(floor),
+            lat=data.get("lat"),
+            lon=data.get("lon")
+        )
 
 
 @dataclass
@@ -47,6 +157,9 @@ class RouteInfo:
     distance_km: float
     duration_minutes: float
     geometry: Dict[str, Any]
+    # Route vertices as a contiguous (N, 2) lat/lon array, empty when the
+    # geometry is not a single LineString
+    path: np.ndarray = field(default_factory=lambda: np.empty((0, 2)))
 
 
 class GeometryUtils:
@@ -87,27 +200,142 @@ class GeometryUtils:
             
         return inside
     
+    @staticmethod
+    def point_in_polygon_vec(lat: float, lon: float,
+                             xi: np.ndarray, yi: np.ndarray, yj: np.ndarray,
+                             slope: np.ndarray) -> bool:
+        """
+        Vectorized ray-casting test against precomputed polygon edge arrays.
+        
+        Edge i runs from vertex i to vertex i-1 (wrapping), matching the
+        scalar `point_in_polygon`.
+        
+        Args:
+            lat: Latitude of the point to test
+            lon: Longitude of the point to test
+            xi: Longitudes of the polygon vertices
+            yi: Latitudes of the polygon vertices
+            yj: Latitudes of the previous vertices (np.roll(yi, 1))
+            slope: Per-edge inverse slopes, (xj - xi) / (yj - yi + eps), so
+                each test is a multiply-add with no division
+            
+        Returns:
+            bool: True if point is inside polygon, False otherwise
+        """
+        crosses = (yi > lat) != (yj > lat)
+        left_of_edge = lon < slope * (lat - yi) + xi
+        return bool(np.logical_xor.reduce(crosses & left_of_edge))
+    
+    @staticmethod
+    def points_in_polygon_vec(lats: np.ndarray, lons: np.ndarray,
+                              xi: np.ndarray, yi: np.ndarray, yj: np.ndarray,
+                              slope: np.ndarray) -> np.ndarray:
+        """
+        Batched form of `point_in_polygon_vec` for many points at once.
+        
+        Args:
+            lats: (M,) latitudes of the points to test
+            lons: (M,) longitudes of the points to test
+            xi, yi, yj, slope: Precomputed edge arrays, as for
+                `point_in_polygon_vec`
+            
+        Returns:
+            (M,) boolean array, True where the point is inside the polygon
+        """
+        lat = np.asarray(lats, dtype=np.float64)[:, None]
+        lon = np.asarray(lons, dtype=np.float64)[:, None]
+        crosses = (yi > lat) != (yj > lat)
+        left_of_edge = lon < slope * (lat - yi) + xi
+        return np.logical_xor.reduce(crosses & left_of_edge, axis=1)
+    
     @staticmethod
     def calculate_bounding_box(poly: List[Tuple[float, float]]) -> List[List[float]]:
         """
         Calculate the bounding box (min/max lat/lon) for a polygon.
         
         Args:
-            poly: List of (lat, lon) tuples defining the polygon
+            poly: Sequence or (N, 2) array of (lat, lon) points defining the polygon
             
         Returns:
             List of [[min_lat, min_lon], [max_lat, max_lon]]
         """
-        if not poly:
+        if len(poly) == 0:
             return [[0, 0], [0, 0]]
             
-        lats = [pt[0] for pt in poly]
-        lons = [pt[1] for pt in poly]
+        # Single C-level reduction per extreme over the (N, 2) array
+        arr = np.asarray(poly, dtype=np.float64)
+        return [arr.min(axis=0).tolist(), arr.max(axis=0).tolist()]
+    
+    @staticmethod
+    def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+        """
+        Great-circle distance between two points.
+        
+        Args:
+            lat1: Latitude of the first point
+            lon1: Longitude of the first point
+            lat2: Latitude of the second point
+            lon2: Longitude of the second point
+            
+        Returns:
+            Distance in kilometres
+        """
+        phi1, phi2 = math.radians(lat1), math.radians(lat2)
+        dphi = phi2 - phi1
+        dlmb = math.radians(lon2 - lon1)
+        a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+        return 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+    
+    @staticmethod
+    def simplify_polygon(poly: np.ndarray, tolerance: float) -> np.ndarray:
+        """
+        Simplify a polygon outline or polyline with the Douglas-Peucker algorithm.
+        
+        Vertices closer than `tolerance` (in degrees) to the chord between
+        their kept neighbours are dropped. Meant for display only; access
+        checks should keep using the full boundary.
+        
+        Args:
+            poly: (N, 2) array of (lat, lon) points defining the polygon or line
+            tolerance: Maximum allowed deviation from the original outline
+            
+        Returns:
+            (M, 2) array of the kept points, M <= N, in the original order
+        """
+        points = np.asarray(poly, dtype=np.float64).reshape(-1, 2)
+        n = len(points)
+        
+        if n < 3 or tolerance <= 0:
+            return points
         
-        min_lat, max_lat = min(lats), max(lats)
-        min_lon, max_lon = min(lons), max(lons)
+        keep = np.zeros(n, dtype=bool)
+        keep[0] = keep[-1] = True
+        stack = [(0, n - 1)]
         
-        return [[min_lat, min_lon], [max_lat, max_lon]]
+        while stack:
+            start, end = stack.pop()
+            if end - start < 2:
+                continue
+            
+            anchor = points[start]
+            chord = points[end] - anchor
+            offsets = points[start + 1:end] - anchor
+            chord_len = np.hypot(chord[0], chord[1])
+            
+            if chord_len == 0.0:
+                # Closed ring: first and last vertex coincide
+                distances = np.hypot(offsets[:, 0], offsets[:, 1])
+            else:
+                distances = np.abs(chord[0] * offsets[:, 1] - chord[1] * offsets[:, 0]) / chord_len
+            
+            farthest = int(np.argmax(distances))
+            if distances[farthest] > tolerance:
+                split = start + 1 + farthest
+                keep[split] = True
+                stack.append((start, split))
+                stack.append((split, end))
+        
+        return points[keep]
 
 
 class DataLoader:
@@ -126,29 +354,26 @@ class DataLoader:
         """
         try:
             p = Path(file_path)
-            with p.open("r", encoding="utf-8") as f:
-                rooms_data = json.load(f)
-                
-            rooms = []
-            for room_data in rooms_data:
-                room = Room(
-                    room_name=room_data.get("room_name", ""),
-                    building=room_data.get("building", ""),
-                    floor=room_data.get("floor"),
-                    lat=room_data.get("lat"),
-                    lon=room_data.get("lon")
-                )
-                rooms.append(room)
+            if ijson is not None and p.stat().st_size >= _STREAM_PARSE_MIN_BYTES:
+                # Stream records straight into Room objects to avoid holding
+                # the whole decoded list in memory alongside them
+                with p.open("rb") as f:
+                    rooms = [Room.from_dict(room_data)
+                             for room_data in ijson.items(f, "item", use_float=True)]
+            else:
+                raw = p.read_bytes()
+                rooms_data = orjson.loads(raw) if orjson else json.loads(raw)
+                rooms = [Room.from_dict(room_data) for room_data in rooms_data]
                 
             # Sort rooms by name for consistent ordering
             return sorted(rooms, key=lambda x: x.room_name.lower())
             
-        except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+        except (FileNotFoundError, KeyError) + _JSON_ERRORS as e:
             print(f"Error loading rooms data: {e}")
             return []
     
     @staticmethod
-    def load_campus_boundary(file_path: str = "campus-room-finder/boundaries.csv") -> List[Tuple[float, float]]:
+    def load_campus_boundary(file_path: str = "campus-room-finder/boundaries.csv") -> np.ndarray:
         """
         Load campus boundary polygon from CSV file.
         
@@ -161,81 +386,94 @@ class DataLoader:
             file_path: Path to the boundaries CSV file
             
         Returns:
-            List of (lat, lon) tuples defining the campus boundary polygon
+            Contiguous (N, 2) float64 array of (lat, lon) rows defining the
+            campus boundary polygon; shape (0, 2) if nothing could be loaded
         """
-        poly = []
         p = Path(file_path)
         
         if not p.exists():
             print(f"Boundaries file not found: {file_path}")
-            return []
+            return np.empty((0, 2), dtype=np.float64)
+        
+        # pandas is only needed here, once per process, so it is not paid
+        # for on import of this module
+        import pandas as pd
             
         try:
-            with p.open("r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    try:
-                        lat, lon = DataLoader._parse_coordinate_row(row)
-                        poly.append((lat, lon))
-                    except (TypeError, ValueError) as e:
-                        print(f"Skipping invalid coordinate row: {e}")
-                        continue
-                        
+            # Only coordinate columns are parsed; names/descriptions are skipped
+            df = pd.read_csv(p, dtype=str, usecols=lambda c: c in _COORDINATE_COLUMNS)
         except Exception as e:
             print(f"Error loading boundary data: {e}")
-            
-        print(f"Loaded {len(poly)} boundary points")
-        return poly
-    
-    @staticmethod
-    def _parse_coordinate_row(row: Dict[str, str]) -> Tuple[float, float]:
-        """
-        Parse a single row from the boundary CSV to extract coordinates.
+            return np.empty((0, 2), dtype=np.float64)
         
-        Args:
-            row: Dictionary representing a CSV row
-            
-        Returns:
-            Tuple of (lat, lon) coordinates
-            
-        Raises:
-            ValueError: If coordinates cannot be parsed from the row
-        """
-        # Try parsing WKT format first
-        wkt = (row.get("WKT") or row.get("wkt") or "").strip()
-        if wkt:
-            # Look for POINT(lon lat) format
-            m = re.search(r"POINT\s*\(\s*(-?\d+\.\d+)\s+(-?\d+\.\d+)\s*\)", wkt, re.IGNORECASE)
-            if not m:
-                # Fallback to any two decimal numbers
-                m = re.search(r"(-?\d+\.\d+)[,\s]+(-?\d+\.\d+)", wkt)
-            if m:
-                # Note: WKT typically uses (lon, lat) format
-                lon, lat = float(m.group(1)), float(m.group(2))
-                return lat, lon
-                
-        # Try standard lat/lon columns
-        lat = row.get("lat") or row.get("latitude") or row.get("y")
-        lon = row.get("lon") or row.get("longitude") or row.get("x")
+        lats = pd.Series(np.nan, index=df.index)
+        lons = pd.Series(np.nan, index=df.index)
+        
+        # Try parsing WKT format first, one vectorized regex pass per pattern
+        wkt_col = next((c for c in _WKT_COLUMNS if c in df.columns), None)
+        if wkt_col:
+            wkt = df[wkt_col].fillna("").str.strip()
+            # Look for POINT(lon lat) format, falling back to any two decimal numbers
+            coords = wkt.str.extract(_WKT_POINT_RE)
+            coords = coords.fillna(wkt.str.extract(_WKT_ANY_RE))
+            # Note: WKT typically uses (lon, lat) format
+            lons = pd.to_numeric(coords[0])
+            lats = pd.to_numeric(coords[1])
         
-        if lat is None or lon is None:
-            raise ValueError("No valid coordinates found in row")
+        # Fill remaining rows from standard lat/lon columns
+        lat_col = next((c for c in _LAT_COLUMNS if c in df.columns), None)
+        lon_col = next((c for c in _LON_COLUMNS if c in df.columns), None)
+        if lat_col and lon_col:
+            lats = lats.fillna(pd.to_numeric(df[lat_col], errors="coerce"))
+            lons = lons.fillna(pd.to_numeric(df[lon_col], errors="coerce"))
+        
+        valid = lats.notna() & lons.notna()
+        skipped = int((~valid).sum())
+        if skipped:
+            print(f"Skipping {skipped} invalid coordinate rows")
             
-        return float(lat), float(lon)
+        poly = np.column_stack((lats[valid].to_numpy(np.float64), lons[valid].to_numpy(np.float64)))
+        print(f"Loaded {len(poly)} boundary points")
+        return np.ascontiguousarray(poly)
 
 
 class RoomSearchEngine:
     """Handles room searching with both substring and fuzzy matching."""
     
-    def __init__(self, rooms: List[Room]):
+    def __init__(self, rooms: Sequence[Room]):
         """
         Initialize the search engine with a list of rooms.
         
         Args:
-            rooms: List of Room objects to search through
+            rooms: List or tuple of Room objects to search through
         """
         self.rooms = rooms
         self.room_names = [room.room_name for room in rooms]
+        # Lowercased names are computed once instead of on every query
+        self._room_names_lower = [name.lower() for name in self.room_names]
+        # Pre-normalized fuzzy choices so rapidfuzz skips per-query processing
+        self._choices_norm = [utils.default_process(name) for name in self.room_names]
+        # Trigram -> indices of rooms whose lowercase name contains it
+        self._trigram_index: Dict[str, Set[int]] = {}
+        for i, name_lower in enumerate(self._room_names_lower):
+            for trigram in self._trigrams(name_lower):
+                self._trigram_index.setdefault(trigram, set()).add(i)
+        # Distinct names in display order, for the browse-all dropdown
+        self.unique_room_names = sorted(set(self.room_names))
+        # Name -> first room with that name, for O(1) selection lookups
+        self._room_by_name: Dict[str, Room] = {}
+        for room in rooms:
+            self._room_by_name.setdefault(room.room_name, room)
+        # Room coordinates as flat arrays for spatial queries; missing ones
+        # are NaN, which never compares inside a box or wins a nearest search
+        self._lats = np.array(
+            [np.nan if room.lat is None else room.lat for room in rooms], dtype=np.float64
+        )
+        self._lons = np.array(
+            [np.nan if room.lon is None else room.lon for room in rooms], dtype=np.float64
+        )
+        # Identifies the room list, so results can be cached outside the engine
+        self.fingerprint = hash(tuple(self.room_names))
     
     def search(self, query: str, fuzzy_limit: int = 5, fuzzy_threshold: int = 60) -> List[Room]:
         """
@@ -250,36 +488,71 @@ class RoomSearchEngine:
             List of Room objects matching the search criteria
         """
         if not query:
-            return self.rooms.copy()
+            return list(self.rooms)
             
         query_lower = query.lower()
         
-        # Find substring matches (exact substring matching)
-        substring_matches = [
-            room for room in self.rooms 
-            if query_lower in room.room_name.lower()
-        ]
+        # Substring and fuzzy matches collected as indices into self.rooms
+        matched = self._substring_indices(query_lower)
+        matched.update(self._fuzzy_indices(query, fuzzy_limit, fuzzy_threshold))
         
-        # Find fuzzy matches using rapidfuzz
-        fuzzy_matches = process.extract(
-            query, 
-            self.room_names, 
-            limit=fuzzy_limit, 
-            score_cutoff=fuzzy_threshold
-        )
+        # Return sorted results
+        return [self.rooms[i] for i in sorted(matched, key=self._room_names_lower.__getitem__)]
+    
+    def get_room(self, room_name: str) -> Optional[Room]:
+        """
+        Look up a room by its exact name.
         
-        # Get room objects for fuzzy matches
-        fuzzy_names = {match[0] for match in fuzzy_matches}
-        fuzzy_rooms = [
-            room for room in self.rooms 
-            if room.room_name in fuzzy_names
-        ]
+        Args:
+            room_name: Room name as shown in the UI
+            
+        Returns:
+            The first room with that name, or None if there is none
+        """
+        return self._room_by_name.get(room_name)
+    
+    def nearest_room(self, lat: float, lon: float) -> Optional[Room]:
+        """
+        Find the room closest to a point.
         
-        # Combine results, removing duplicates
-        combined_rooms = {room.room_name: room for room in (substring_matches + fuzzy_rooms)}
+        Uses an equirectangular distance, which is exact enough at campus
+        scale, evaluated over all rooms in one vectorized pass.
         
-        # Return sorted results
-        return sorted(combined_rooms.values(), key=lambda x: x.room_name.lower())
+        Args:
+            lat: Latitude of the point
+            lon: Longitude of the point
+            
+        Returns:
+            The nearest Room with coordinates, or None if there is none
+        """
+        dx = (self._lons - lon) * np.cos(np.radians(lat))
+        dy = self._lats - lat
+        dist_sq = dx * dx + dy * dy
+        
+        if not np.isfinite(dist_sq).any():
+            return None
+            
+        return self.rooms[int(np.nanargmin(dist_sq))]
+    
+    def rooms_in_bbox(self, min_lat: float, min_lon: float,
+                      max_lat: float, max_lon: float) -> List[Room]:
+        """
+        Get the rooms inside a lat/lon bounding box, e.g. the map viewport.
+        
+        Args:
+            min_lat: Southern edge
+            min_lon: Western edge
+            max_lat: Northern edge
+            max_lon: Eastern edge
+            
+        Returns:
+            List of Room objects inside the box, in engine order
+        """
+        inside = (
+            (self._lats >= min_lat) & (self._lats <= max_lat)
+            & (self._lons >= min_lon) & (self._lons <= max_lon)
+        )
+        return [self.rooms[i] for i in np.flatnonzero(inside)]
     
     def get_fuzzy_suggestions(self, query: str, limit: int = 5, threshold: int = 60) -> List[str]:
         """
@@ -296,14 +569,219 @@ class RoomSearchEngine:
         if not query:
             return []
             
-        fuzzy_matches = process.extract(
-            query, 
-            self.room_names, 
-            limit=limit, 
+        return [
+            self.room_names[index]
+            for index in self._fuzzy_indices(query, limit, threshold)
+        ]
+    
+    def search_batch(self, queries: List[str], limit: int = 5, threshold: int = 60) -> List[List[Room]]:
+        """
+        Fuzzy-match several queries at once.
+        
+        All queries are scored against every room name in a single
+        multithreaded rapidfuzz.process.cdist call, and the top matches per
+        query are picked with np.argpartition instead of a full sort.
+        
+        Args:
+            queries: Search query strings
+            limit: Maximum number of matches per query
+            threshold: Minimum match score (0-100)
+            
+        Returns:
+            One list of Room objects per query, best match first
+        """
+        k = min(limit, len(self.rooms))
+        if not queries or k <= 0:
+            return [[] for _ in queries]
+            
+        scores = process.cdist(
+            [utils.default_process(query) for query in queries],
+            self._choices_norm,
+            scorer=fuzz.WRatio,
+            processor=None,
+            score_cutoff=threshold,
+            workers=-1
+        )
+        top_k = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        
+        results = []
+        for row, candidates in zip(scores, top_k):
+            # Best score first, ties broken by room order like process.extract
+            ranked = candidates[np.lexsort((candidates, -row[candidates]))]
+            results.append([self.rooms[i] for i in ranked if row[i] >= threshold])
+        return results
+    
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Distinct three-character substrings of text."""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    def _substring_indices(self, query_lower: str) -> Set[int]:
+        """
+        Find rooms whose lowercase name contains the query.
+        
+        Queries of three or more characters only verify the rooms that hold
+        every query trigram; shorter ones fall back to scanning all names.
+        
+        Args:
+            query_lower: Lowercased search query
+            
+        Returns:
+            Indices into self.rooms of the matching rooms
+        """
+        if len(query_lower) < 3:
+            return {
+                i for i, name_lower in enumerate(self._room_names_lower)
+                if query_lower in name_lower
+            }
+        
+        postings = []
+        for trigram in self._trigrams(query_lower):
+            posting = self._trigram_index.get(trigram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        
+        # Intersect smallest first so the candidate set shrinks fastest
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        
+        return {i for i in candidates if query_lower in self._room_names_lower[i]}
+    
+    def _fuzzy_indices(self, query: str, limit: int, threshold: int) -> List[int]:
+        """
+        Run rapidfuzz against the pre-normalized room names.
+        
+        Args:
+            query: Search query string
+            limit: Maximum number of matches
+            threshold: Minimum match score (0-100)
+            
+        Returns:
+            Indices into self.rooms of the best matches, best first
+        """
+        matches = process.extract(
+            utils.default_process(query),
+            self._choices_norm,
+            scorer=fuzz.WRatio,
+            processor=None,
+            limit=limit,
             score_cutoff=threshold
         )
+        return [index for _, _, index in matches]
+
+
+class _RouteStore:
+    """
+    Persistent route cache in a small SQLite file, shared across processes.
+    
+    Disabled unless `Config.ROUTE_CACHE_FILE` is set. The stored routes start
+    at the user's rounded GPS position, so enabling it writes location-derived
+    data to disk; point it at a private path and keep the TTL short.
+    
+    Keys are blake2b digests of the rounded request, values the OSRM route
+    JSON. Rows older than the TTL are ignored and pruned, and only the
+    newest `max_rows` are kept. Storage errors are treated as cache misses
+    so routing never fails because the cache is unavailable; if the file
+    cannot be opened the store disables itself after one warning.
+    """
+    
+    def __init__(self, path: str, ttl: float, max_rows: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Content-addressed key for one route request."""
+        return hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """
+        Open the database on first use, creating or migrating the table.
+        
+        Returns:
+            Open connection, or None if the store is disabled
+        """
+        if self._conn is None and not self._disabled:
+            try:
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(routes)")}
+                if columns and "created_at" not in columns:
+                    # Table from before entries expired; it is only a cache
+                    conn.execute("DROP TABLE routes")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS routes ("
+                    "key TEXT PRIMARY KEY, route TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS routes_created_at ON routes (created_at)"
+                )
+                conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                print(f"Route cache disabled, cannot open {self.path}: {e}")
+                self._disabled = True
+        return self._conn
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a route that has not yet expired.
         
-        return [match[0] for match in fuzzy_matches]
+        Args:
+            key: Key from `_RouteStore.key`
+            
+        Returns:
+            Stored route data, or None on a miss or storage error
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                if conn is None:
+                    return None
+                row = conn.execute(
+                    "SELECT route FROM routes WHERE key = ? AND created_at >= ?",
+                    (key, time.time() - self.ttl)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return json.loads(row[0]) if row else None
+    
+    def set(self, key: str, route_data: Dict[str, Any]) -> None:
+        """
+        Store a route and prune expired and surplus rows.
+        
+        Args:
+            key: Key from `_RouteStore.key`
+            route_data: Distance, duration and GeoJSON geometry of the route
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                if conn is None:
+                    return
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO routes (key, route, created_at) VALUES (?, ?, ?)",
+                        (key, json.dumps(route_data, separators=(",", ":")), now)
+                    )
+                    # Writes only follow a network fetch, so pruning here is cheap
+                    conn.execute("DELETE FROM routes WHERE created_at < ?", (now - self.ttl,))
+                    conn.execute(
+                        "DELETE FROM routes WHERE key IN ("
+                        "SELECT key FROM routes ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                        (self.max_rows,)
+                    )
+        except sqlite3.Error as e:
+            print(f"Route cache write failed: {e}")
+
+
+class _NoRouteFound(Exception):
+    """Raised inside the cached route fetch so "no route" answers are not cached."""
 
 
 class RouteCalculator:
@@ -312,57 +790,210 @@ class RouteCalculator:
     @staticmethod
     def get_walking_route(from_lat: float, from_lon: float, 
                          to_lat: float, to_lon: float, 
-                         timeout: int = 5) -> Optional[RouteInfo]:
+                         timeout: int = 5,
+                         need_geometry: bool = True) -> Optional[RouteInfo]:
         """
         Calculate walking route between two points using OSRM routing service.
         
+        Coordinates are rounded to 5 decimals (~1 m) and successful lookups
+        are memoized, so GPS jitter and repeated selections reuse the result.
+        Destinations within Config.DIRECT_ROUTE_MAX_KM are answered with a
+        straight line without asking OSRM, since a routed path that short
+        adds nothing the user can act on.
+        
         Args:
             from_lat: Starting latitude
             from_lon: Starting longitude  
             to_lat: Destination latitude
             to_lon: Destination longitude
             timeout: Request timeout in seconds
+            need_geometry: Request the full route geometry; when False OSRM
+                returns a simplified overview, which is enough for distance
+                and duration and much smaller to download and parse
             
         Returns:
             RouteInfo object with distance, duration, and geometry, or None if failed
         """
+        direct_km = GeometryUtils.haversine_km(from_lat, from_lon, to_lat, to_lon)
+        if direct_km < Config.DIRECT_ROUTE_MAX_KM:
+            return RouteCalculator._direct_route(from_lat, from_lon, to_lat, to_lon, direct_km)
+        
         try:
+            route = RouteCalculator._route_cached(
+                round(from_lat, 5), round(from_lon, 5),
+                round(to_lat, 5), round(to_lon, 5),
+                timeout, need_geometry
+            )
+        except _NoRouteFound:
+            return None
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            print(f"Route calculation failed: {e}")
+            return None
+        
+        # The memoized RouteInfo is shared; hand each caller its own copy
+        return copy.deepcopy(route)
+    
+    @staticmethod
+    def get_walking_routes_many(from_point: Tuple[float, float],
+                                destinations: List[Tuple[float, float]],
+                                timeout: int = 5,
+                                max_workers: int = 8,
+                                need_geometry: bool = True) -> List[Optional[RouteInfo]]:
+        """
+        Calculate walking routes from one point to several destinations concurrently.
+        
+        Requests are fanned out over a thread pool sharing the pooled HTTP
+        session, so total latency is roughly that of the slowest request.
+        
+        Args:
+            from_point: Starting (lat, lon)
+            destinations: List of destination (lat, lon) tuples
+            timeout: Request timeout in seconds
+            max_workers: Maximum number of concurrent requests
+            need_geometry: Request full route geometries (see get_walking_route)
+            
+        Returns:
+            List of RouteInfo objects (or None on failure), in destination order
+        """
+        if not destinations:
+            return []
+            
+        from_lat, from_lon = from_point
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(destinations))) as executor:
+            return list(executor.map(
+                lambda dest: RouteCalculator.get_walking_route(
+                    from_lat, from_lon, dest[0], dest[1],
+                    timeout=timeout, need_geometry=need_geometry
+                ),
+                destinations
+            ))
+    
+    @staticmethod
+    def _direct_route(from_lat: float, from_lon: float,
+                      to_lat: float, to_lon: float,
+                      distance_km: float) -> RouteInfo:
+        """
+        Straight-line route for destinations too close to be worth routing.
+        
+        Args:
+            from_lat: Starting latitude
+            from_lon: Starting longitude
+            to_lat: Destination latitude
+            to_lon: Destination longitude
+            distance_km: Great-circle distance between the two points
+            
+        Returns:
+            RouteInfo with a two-point path and a walking-speed duration
+        """
+        return RouteInfo(
+            distance_km=round(distance_km, 2),
+            duration_minutes=round(distance_km / Config.WALKING_SPEED_KMH * 60, 1),
+            geometry={
+                "type": "LineString",
+                "coordinates": [[from_lon, from_lat], [to_lon, to_lat]]
+            },
+            path=np.array([[from_lat, from_lon], [to_lat, to_lon]], dtype=np.float64)
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _route_cached(from_lat: float, from_lon: float,
+                      to_lat: float, to_lon: float,
+                      timeout: int, need_geometry: bool) -> RouteInfo:
+        """
+        Fetch a route from the persistent store or OSRM; failures, including
+        OSRM finding no route, raise so they are never cached.
+        
+        Args:
+            from_lat: Rounded starting latitude
+            from_lon: Rounded starting longitude
+            to_lat: Rounded destination latitude
+            to_lon: Rounded destination longitude
+            timeout: Request timeout in seconds
+            need_geometry: Request the full rather than simplified overview
+            
+        Returns:
+            RouteInfo object
+            
+        Raises:
+            _NoRouteFound: If OSRM returned no route
+        """
+        overview = "full" if need_geometry else "simplified"
+        store_key = _RouteStore.key("foot", overview, from_lat, from_lon, to_lat, to_lon)
+        route_data = _ROUTE_STORE.get(store_key) if _ROUTE_STORE else None
+        
+        if route_data is None:
             # OSRM API expects lon,lat format
             url = (f"http://router.project-osrm.org/route/v1/foot/"
                    f"{from_lon},{from_lat};{to_lon},{to_lat}?"
-                   f"overview=full&geometries=geojson")
+                   f"overview={overview}&geometries=geojson")
             
-            response = requests.get(url, timeout=timeout)
+            response = _SESSION.get(url, timeout=timeout)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
             
             if not data or "routes" not in data or len(data["routes"]) == 0:
-                return None
+                raise _NoRouteFound()
                 
             route_data = data["routes"][0]
-            
-            return RouteInfo(
-                distance_km=round(route_data["distance"] / 1000, 2),
-                duration_minutes=round(route_data["duration"] / 60, 1),
-                geometry=route_data["geometry"]
-            )
-            
-        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
-            print(f"Route calculation failed: {e}")
-            return None
+            if _ROUTE_STORE:
+                _ROUTE_STORE.set(store_key, {
+                    "distance": route_data["distance"],
+                    "duration": route_data["duration"],
+                    "geometry": route_data["geometry"]
+                })
+        
+        geometry = route_data["geometry"]
+        
+        # GeoJSON is (lon, lat); flip the columns once into a packed array
+        if geometry.get("type") == "LineString" and geometry.get("coordinates"):
+            coords = np.asarray(geometry["coordinates"], dtype=np.float64)
+            path = np.ascontiguousarray(coords[:, ::-1])
+        else:
+            path = np.empty((0, 2))
+        
+        return RouteInfo(
+            distance_km=round(route_data["distance"] / 1000, 2),
+            duration_minutes=round(route_data["duration"] / 60, 1),
+            geometry=geometry,
+            path=path
+        )
 
 
 class AccessController:
     """Handles access control based on GPS location and campus boundaries."""
     
-    def __init__(self, campus_boundary: List[Tuple[float, float]]):
+    def __init__(self, campus_boundary: np.ndarray):
         """
         Initialize access controller with campus boundary.
         
         Args:
-            campus_boundary: List of (lat, lon) tuples defining campus boundary
+            campus_boundary: (N, 2) array of (lat, lon) rows defining campus boundary
         """
-        self.campus_boundary = campus_boundary
+        self.campus_boundary = np.asarray(campus_boundary, dtype=np.float64).reshape(-1, 2)
+        
+        # Precompute edge arrays once so each check is a handful of C loops
+        poly = self.campus_boundary
+        self._yi = np.ascontiguousarray(poly[:, 0])
+        self._xi = np.ascontiguousarray(poly[:, 1])
+        self._yj = np.roll(self._yi, 1)
+        self._slope = (np.roll(self._xi, 1) - self._xi) / (self._yj - self._yi + 1e-12)
+        
+        # Bounding box used to reject far-away points before the edge walk
+        self._bbox = GeometryUtils.calculate_bounding_box(poly)
+        
+        # Coarse grid over the bounding box: cells no edge passes through are
+        # wholly inside or outside and answer from the grid; only cells on
+        # the boundary fall through to the exact edge walk. Nested lists
+        # index several times faster than a NumPy array for single lookups
+        self._grid, self._grid_origin, self._grid_scale = (
+            self._build_grid(_GRID_SIZE) if len(poly) else (None, None, None)
+        )
+        
+        # Last (key, result) check, keyed on coordinates quantized to ~1 m.
+        # Stored as one tuple so concurrent sessions never pair a key with
+        # another thread's result.
+        self._last = (None, None)
     
     def is_location_valid(self, location: Optional[UserLocation]) -> Tuple[bool, str]:
         """
@@ -377,19 +1008,92 @@ class AccessController:
         if location is None:
             return False, "GPS is not available. This service is restricted to users physically within the MUT campus boundaries."
         
-        if not self.campus_boundary:
+        if len(self.campus_boundary) == 0:
             return False, "Campus boundary data is not available."
+        
+        # A polling browser reports the same fix over and over; reuse the answer
+        key = (round(location.lat, 5), round(location.lon, 5))
+        last_key, last_result = self._last
+        if key == last_key:
+            return last_result
+        
+        result = self._check_inside(location)
+        self._last = (key, result)
+        return result
+    
+    def _build_grid(self, size: int) -> Tuple[List[List[int]], Tuple[float, float], Tuple[float, float]]:
+        """
+        Classify each cell of a size x size grid over the bounding box.
+        
+        Args:
+            size: Number of cells along each axis
             
-        is_inside = GeometryUtils.point_in_polygon(
-            location.lat, 
-            location.lon, 
-            self.campus_boundary
-        )
+        Returns:
+            Tuple of (grid, origin, scale): grid is nested lists indexed
+            [lat_cell, lon_cell] holding 1 inside, 0 outside, -1 crossed by
+            an edge (needs the exact test); origin is the (lat, lon) grid
+            corner and scale the cells per degree along each axis
+        """
+        (min_lat, min_lon), (max_lat, max_lon) = self._bbox
+        lat_step = (max_lat - min_lat) / size or 1.0
+        lon_step = (max_lon - min_lon) / size or 1.0
+        
+        # Classify every cell by its centre in one batched test
+        centres_lat = min_lat + (np.arange(size) + 0.5) * lat_step
+        centres_lon = min_lon + (np.arange(size) + 0.5) * lon_step
+        lat_grid, lon_grid = np.meshgrid(centres_lat, centres_lon, indexing="ij")
+        grid = GeometryUtils.points_in_polygon_vec(
+            lat_grid.ravel(), lon_grid.ravel(),
+            self._xi, self._yi, self._yj, self._slope
+        ).astype(np.int8).reshape(size, size)
+        
+        # Conservatively flag every cell under each edge's bounding box
+        lat_cells = np.clip(((self._yi - min_lat) / lat_step).astype(int), 0, size - 1)
+        lon_cells = np.clip(((self._xi - min_lon) / lon_step).astype(int), 0, size - 1)
+        prev_lat_cells = np.roll(lat_cells, 1)
+        prev_lon_cells = np.roll(lon_cells, 1)
+        for r0, r1, c0, c1 in zip(np.minimum(lat_cells, prev_lat_cells),
+                                  np.maximum(lat_cells, prev_lat_cells),
+                                  np.minimum(lon_cells, prev_lon_cells),
+                                  np.maximum(lon_cells, prev_lon_cells)):
+            grid[r0:r1 + 1, c0:c1 + 1] = -1
+        
+        return grid.tolist(), (min_lat, min_lon), (1.0 / lat_step, 1.0 / lon_step)
+    
+    def _check_inside(self, location: UserLocation) -> Tuple[bool, str]:
+        """
+        Run the point-in-polygon test for a location.
+        
+        Args:
+            location: UserLocation object with GPS coordinates
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        (min_lat, min_lon), (max_lat, max_lon) = self._bbox
+        if not (min_lat <= location.lat <= max_lat and min_lon <= location.lon <= max_lon):
+            is_inside = False
+        elif (cell := self._grid_cell(location)) >= 0:
+            is_inside = bool(cell)
+        elif _pip_numba is not None:
+            is_inside = _pip_numba(location.lon, location.lat, self._xi, self._yi)
+        else:
+            is_inside = GeometryUtils.point_in_polygon_vec(
+                location.lat,
+                location.lon,
+                self._xi, self._yi, self._yj, self._slope
+            )
         
         if not is_inside:
             return False, "You are outside the MUT campus boundaries. This application is only accessible from within campus."
             
         return True, ""
+    
+    def _grid_cell(self, location: UserLocation) -> int:
+        """Grid classification of the cell holding a location inside the bounding box."""
+        row = min(int((location.lat - self._grid_origin[0]) * self._grid_scale[0]), _GRID_SIZE - 1)
+        col = min(int((location.lon - self._grid_origin[1]) * self._grid_scale[1]), _GRID_SIZE - 1)
+        return self._grid[row][col]
 
 
 # Configuration constants
@@ -402,11 +1106,16 @@ class Config:
     
     # Map settings
     DEFAULT_ZOOM = 17
+    MIN_ZOOM = 15  # campus fills the view; lowered only when the drawn area is wider
+    MAX_ZOOM = 19  # deepest level every tile provider serves
+    PAN_BOUNDS_PADDING = 0.2  # fraction of the drawn span added on each side
     ROUTE_COLOR = "green"
     ROUTE_WEIGHT = 4
     CAMPUS_BOUNDARY_COLOR = "blue"
     CAMPUS_BOUNDARY_WEIGHT = 3
     CAMPUS_BOUNDARY_OPACITY = 0.05
+    CAMPUS_BOUNDARY_SIMPLIFY_TOLERANCE = 1e-5  # degrees, roughly 1 m
+    DISPLAY_COORD_DECIMALS = 6  # ~11 cm; keeps coordinates short in map HTML
     
     # Search settings
     FUZZY_MATCH_LIMIT = 5
@@ -414,3 +1123,15 @@ class Config:
     
     # Route calculation
     ROUTE_TIMEOUT = 5
+    DIRECT_ROUTE_MAX_KM = 0.05  # closer destinations skip OSRM and get a straight line
+    WALKING_SPEED_KMH = 5.0
+    ROUTE_SIMPLIFY_TOLERANCE = 1e-5  # degrees, roughly 1 m
+    ROUTE_CACHE_FILE: Optional[str] = None  # opt-in SQLite path; see _RouteStore
+    ROUTE_CACHE_TTL = 86400  # seconds; matches the Streamlit route cache
+    ROUTE_CACHE_MAX_ROWS = 5000
+
+
+# Persistent route cache shared by every session and process, only when configured
+_ROUTE_STORE = _RouteStore(
+    Config.ROUTE_CACHE_FILE, Config.ROUTE_CACHE_TTL, Config.ROUTE_CACHE_MAX_ROWS
+) if Config.ROUTE_CACHE_FILE else None
@@ -8,12 +8,15 @@ MUT brand colors and mobile-first approach.
 """
 
 import streamlit as st
-import folium
-from streamlit_folium import st_folium
+import numpy as np
 from streamlit_js_eval import streamlit_js_eval
-from branca.element import Element
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple
+from functools import lru_cache
+from string import Template
 import base64
+import re
+import math
+import textwrap
 from pathlib import Path
 
 from campus_data_logic import (
@@ -22,6 +25,26 @@ from campus_data_logic import (
     AccessController, Config
 )
 
+# folium is imported where the map is built, so the page header and search
+# UI render before the heavy map modules load
+if TYPE_CHECKING:
+    import folium
+
+
+_CSS_QUOTED_RE = re.compile(r"""('[^']*'|"[^"]*")""")
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{}:;,>])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace, leaving quoted strings intact."""
+    parts = _CSS_QUOTED_RE.split(_CSS_COMMENT_RE.sub("", css))
+    for i in range(0, len(parts), 2):
+        collapsed = _CSS_PUNCT_RE.sub(r"\1", _CSS_SPACE_RE.sub(" ", parts[i]))
+        parts[i] = collapsed.replace(";}", "}")
+    return "".join(parts).strip()
+
 
 class MUTTheme:
     """MUT University brand colors and styling constants."""
@@ -44,9 +67,15 @@ class MUTTheme:
     GRADIENT_ACCENT = "linear-gradient(135deg, #2196F3, #1976D2)"
     
     @classmethod
+    @lru_cache(maxsize=1)
     def get_custom_css(cls) -> str:
-        """Get comprehensive CSS styling for the application."""
-        return f"""
+        """
+        Get comprehensive CSS styling for the application.
+        
+        Brand colors are constants, so the stylesheet is built and minified
+        once per process and reused on every rerun.
+        """
+        return _minify_css(f"""
         <style>
         /* Import Google Fonts */
         @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
@@ -90,7 +119,7 @@ class MUTTheme:
             left: 0;
             right: 0;
             bottom: 0;
-            background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><circle cx="50" cy="50" r="2" fill="white" opacity="0.1"/><circle cx="20" cy="20" r="1" fill="white" opacity="0.1"/><circle cx="80" cy="30" r="1.5" fill="white" opacity="0.1"/></svg>');
+            background: url('app/static/header_pattern.svg');
             pointer-events: none;
         }}
         
@@ -136,7 +165,7 @@ class MUTTheme:
         }}
         
         /* Mobile-First Search Section */
-        .search-container {{
+        .st-key-search-container {{
             background: white;
             border-radius: 16px;
             padding: 1rem;
@@ -145,24 +174,24 @@ class MUTTheme:
             border: 1px solid #E0E0E0;
         }}
         
-        .search-container .stTextInput > div > div > input {{
+        .st-key-search-container .stTextInput > div > div > input {{
             border: 2px solid #E0E0E0;
             border-radius: 12px;
             padding: 0.75rem 1rem 0.75rem 2.5rem;
             font-size: 1rem;
             transition: all 0.3s ease;
-            background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" fill="%23666" viewBox="0 0 24 24"><path d="M15.5 14h-.79l-.28-.27C15.41 12.59 16 11.11 16 9.5 16 5.91 13.09 3 9.5 3S3 5.91 3 9.5 5.91 16 9.5 16c1.61 0 3.09-.59 4.23-1.57l.27.28v.79l5 4.99L20.49 19l-4.99-5zm-6 0C7.01 14 5 11.99 5 9.5S7.01 5 9.5 5 14 7.01 14 9.5 11.99 14 9.5 14z"/></svg>') no-repeat 12px center;
+            background: url('app/static/search_icon.svg') no-repeat 12px center;
             background-size: 20px;
         }}
         
-        .search-container .stTextInput > div > div > input:focus {{
+        .st-key-search-container .stTextInput > div > div > input:focus {{
             border-color: {cls.PRIMARY_RED};
             box-shadow: 0 0 0 3px rgba(211, 47, 47, 0.1);
             outline: none;
         }}
         
         /* Map Style Selector */
-        .map-style-container {{
+        .st-key-map-style-container {{
             background: white;
             border-radius: 16px;
             padding: 1rem;
@@ -170,13 +199,13 @@ class MUTTheme:
             box-shadow: 0 2px 15px rgba(0,0,0,0.1);
         }}
         
-        .map-style-container .stSelectbox > div > div {{
+        .st-key-map-style-container .stSelectbox > div > div {{
             border: 2px solid #E0E0E0;
             border-radius: 12px;
             transition: all 0.3s ease;
         }}
         
-        .map-style-container .stSelectbox > div > div:focus-within {{
+        .st-key-map-style-container .stSelectbox > div > div:focus-within {{
             border-color: {cls.PRIMARY_RED};
             box-shadow: 0 0 0 3px rgba(211, 47, 47, 0.1);
         }}
@@ -516,7 +545,7 @@ class MUTTheme:
             background: #B71C1C;
         }}
         </style>
-        """
+        """)
 
 
 class MapStyleManager:
@@ -538,25 +567,25 @@ class MapStyleManager:
         "🛰️ Satellite": "Tiles © Esri — Source: Esri, DigitalGlobe and others"
     }
     
-    @classmethod
-    def get_tile_layer(cls, style: str) -> str:
+    # Fallbacks resolved once at class creation
+    _DEFAULT_TILE = TILE_LAYERS["🗺️ Standard"]
+    _DEFAULT_ATTR = ATTRIBUTIONS["🗺️ Standard"]
+    
+    # Only a handful of styles exist, so each lookup is memoized per style
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_tile_layer(style: str) -> str:
         """Get the tile layer URL for a given map style."""
-        return cls.TILE_LAYERS.get(style, cls.TILE_LAYERS["🗺️ Standard"])
+        return MapStyleManager.TILE_LAYERS.get(style, MapStyleManager._DEFAULT_TILE)
     
-    @classmethod
-    def get_attribution(cls, style: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_attribution(style: str) -> str:
         """Get the attribution text for a given map style."""
-        return cls.ATTRIBUTIONS.get(style, cls.ATTRIBUTIONS["🗺️ Standard"])
+        return MapStyleManager.ATTRIBUTIONS.get(style, MapStyleManager._DEFAULT_ATTR)
 
 
-class UIComponents:
-    """Collection of reusable UI components for the campus room finder."""
-    
-    @staticmethod
-    def render_header() -> None:
-        """Render the modern MUT-branded header with logo."""
-        st.markdown(
-            """
+_HEADER_HTML = """
             <div class="mut-header">
                 <div class="header-content">
                     <div class="mut-logo">
@@ -568,48 +597,24 @@ class UIComponents:
                     </div>
                 </div>
             </div>
-            """,
-            unsafe_allow_html=True
-        )
-    
-    @staticmethod
-    def render_search_container() -> None:
-        """Render the styled search input container."""
-        st.markdown('<div class="search-container">', unsafe_allow_html=True)
-    
-    @staticmethod
-    def close_search_container() -> None:
-        """Close the search input container."""
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    @staticmethod
-    def render_map_style_container() -> None:
-        """Render the styled map style selector container."""
-        st.markdown('<div class="map-style-container">', unsafe_allow_html=True)
-    
-    @staticmethod
-    def close_map_style_container() -> None:
-        """Close the map style selector container."""
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    @staticmethod
-    def render_room_details(room: Room) -> None:
-        """
-        Render room details in a modern card format.
-        
-        Args:
-            room: Room object containing room information
-        """
-        st.markdown(
-            f"""
+            """
+
+_STATUS_HTML = """
+            <div class="status-card status-%s">
+                <span class="%s">%s</span>
+                <span>%s</span>
+            </div>
+            """
+
+_ROOM_TEMPLATE = Template("""
             <div class="room-card">
                 <div class="room-header">
                     <div class="room-icon">
                         🚪
                     </div>
                     <div>
-                        <h3 class="room-title">{room.room_name}</h3>
-                        <p class="room-subtitle">{room.building}</p>
+                        <h3 class="room-title">$room_name</h3>
+                        <p class="room-subtitle">$building</p>
                     </div>
                 </div>
                 <div class="room-details">
@@ -617,29 +622,104 @@ class UIComponents:
                         <div class="detail-icon">🏢</div>
                         <div class="detail-text">
                             <div class="detail-label">Building</div>
-                            <div class="detail-value">{room.building}</div>
+                            <div class="detail-value">$building</div>
                         </div>
                     </div>
                     <div class="detail-item">
                         <div class="detail-icon">🛗</div>
                         <div class="detail-text">
                             <div class="detail-label">Floor</div>
-                            <div class="detail-value">{room.floor}</div>
+                            <div class="detail-value">$floor</div>
                         </div>
                     </div>
                     <div class="detail-item">
                         <div class="detail-icon">📍</div>
                         <div class="detail-text">
                             <div class="detail-label">Coordinates</div>
-                            <div class="detail-value">{room.lat:.3f}, {room.lon:.3f}</div>
+                            <div class="detail-value">$lat, $lon</div>
                         </div>
                     </div>
                 </div>
             </div>
-            """,
+            """)
+
+
+class UIComponents:
+    """Collection of reusable UI components for the campus room finder."""
+    
+    _ICON_MAP = {
+        "loading": "🔄",
+        "success": "✅",
+        "info": "ℹ️",
+        "error": "❌"
+    }
+    
+    # One ready-to-fill template per status type; only icon and message vary.
+    _STATUS_TEMPLATES = {
+        status_type: _STATUS_HTML % (
+            status_type,
+            'loading-spinner' if status_type == 'loading' else '',
+            '%s',
+            '%s'
+        )
+        for status_type in ("loading", "success", "info", "error")
+    }
+    
+    @staticmethod
+    def render_header() -> None:
+        """Render the stylesheet and the MUT-branded header as one element."""
+        st.markdown(UIComponents._page_head_html(), unsafe_allow_html=True)
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _page_head_html() -> str:
+        """Custom CSS followed by the header markup, joined once per process."""
+        # Dedented so the header isn't parsed as an indented code block
+        return MUTTheme.get_custom_css() + "\n" + textwrap.dedent(_HEADER_HTML).strip()
+    
+    @staticmethod
+    def search_container():
+        """
+        Styled container for the search input.
+        
+        A keyed st.container gets the `st-key-search-container` CSS class and
+        actually wraps its children, with no extra markdown open/close calls.
+        """
+        return st.container(key="search-container")
+    
+    @staticmethod
+    def map_style_container():
+        """Styled container for the map style selector."""
+        return st.container(key="map-style-container")
+    
+    @staticmethod
+    def render_room_details(room: Room) -> None:
+        """
+        Render room details in a modern card format.
+        
+        Args:
+            room: Room object containing room information
+        """
+        st.markdown(
+            UIComponents._room_html(
+                room.room_name, room.building, room.floor, room.lat, room.lon
+            ),
             unsafe_allow_html=True
         )
     
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _room_html(room_name: str, building: str, floor: str,
+                   lat: float, lon: float) -> str:
+        """Room card markup, memoized per room so re-selection skips formatting."""
+        return _ROOM_TEMPLATE.substitute(
+            room_name=room_name,
+            building=building,
+            floor=floor,
+            lat=f"{lat:.3f}",
+            lon=f"{lon:.3f}"
+        )
+    
     @staticmethod
     def render_status_message(message: str, status_type: str = "info") -> None:
         """
@@ -649,24 +729,15 @@ class UIComponents:
             message: Status message text
             status_type: Type of status (loading, success, info, error)
         """
-        icon_map = {
-            "loading": "🔄",
-            "success": "✅",
-            "info": "ℹ️",
-            "error": "❌"
-        }
+        icon = UIComponents._ICON_MAP.get(status_type, "ℹ️")
+        template = UIComponents._STATUS_TEMPLATES.get(status_type)
         
-        icon = icon_map.get(status_type, "ℹ️")
+        if template is None:
+            html = _STATUS_HTML % (status_type, '', icon, message)
+        else:
+            html = template % (icon, message)
         
-        st.markdown(
-            f"""
-            <div class="status-card status-{status_type}">
-                <span class="{'loading-spinner' if status_type == 'loading' else ''}">{icon}</span>
-                <span>{message}</span>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        st.markdown(html, unsafe_allow_html=True)
     
     @staticmethod
     def render_route_stats(route: RouteInfo) -> None:
@@ -677,25 +748,34 @@ class UIComponents:
             route: RouteInfo object containing route data
         """
         st.markdown(
-            f"""
+            UIComponents._route_stats_html(route.distance_km, route.duration_minutes),
+            unsafe_allow_html=True
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _route_stats_html(distance_km: float, duration_minutes: float) -> str:
+        """Route stats markup, memoized per (distance, duration) pair."""
+        return f"""
             <div class="route-stats">
                 <div class="stat-card">
-                    <div class="stat-value">{route.distance_km}</div>
+                    <div class="stat-value">{distance_km}</div>
                     <div class="stat-label">KM</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{route.duration_minutes}</div>
+                    <div class="stat-value">{duration_minutes}</div>
                     <div class="stat-label">MINS</div>
                 </div>
             </div>
-            """,
-            unsafe_allow_html=True
-        )
+            """
     
     @staticmethod
     def render_suggestions(suggestions: List[str]) -> Optional[str]:
         """
-        Render search suggestions as styled buttons.
+        Render search suggestions as a single row of selectable chips.
+        
+        One radio widget replaces a grid of buttons, and the pick is cleared
+        again in its callback so a suggestion still acts like a one-shot click.
         
         Args:
             suggestions: List of room name suggestions
@@ -708,15 +788,24 @@ class UIComponents:
         
         st.markdown("**💡 Suggestions:**")
         
-        cols = st.columns(min(len(suggestions), 3))
-        
-        for i, room_name in enumerate(suggestions[:6]):  # Limit to 6 suggestions
-            col = cols[i % 3]
-            with col:
-                if st.button(f"➡️ {room_name}", key=f"suggestion_{i}", use_container_width=True):
-                    return room_name
+        st.radio(
+            "Suggestions",
+            suggestions[:6],  # Limit to 6 suggestions
+            index=None,
+            key="suggestion_pick",
+            horizontal=True,
+            label_visibility="collapsed",
+            format_func=lambda room_name: f"➡️ {room_name}",
+            on_change=UIComponents._take_suggestion
+        )
         
-        return None
+        return st.session_state.pop("picked_suggestion", None)
+    
+    @staticmethod
+    def _take_suggestion() -> None:
+        """Move the picked suggestion out of the radio for this rerun only."""
+        st.session_state.picked_suggestion = st.session_state.suggestion_pick
+        st.session_state.suggestion_pick = None
     
     @staticmethod
     def render_footer(map_style: str) -> None:
@@ -747,6 +836,16 @@ class UIComponents:
         )
 
 
+_GPS_JS = """
+            new Promise((resolve) => {
+                navigator.geolocation.getCurrentPosition(
+                    pos => resolve({lat: pos.coords.latitude, lon: pos.coords.longitude}),
+                    err => resolve(null)
+                );
+            })
+            """
+
+
 class GPSManager:
     """Handles GPS location acquisition using JavaScript evaluation."""
     
@@ -759,14 +858,7 @@ class GPSManager:
             UserLocation object with coordinates, or None if unavailable
         """
         user_coords = streamlit_js_eval(
-            js_expressions="""
-            new Promise((resolve) => {
-                navigator.geolocation.getCurrentPosition(
-                    pos => resolve({lat: pos.coords.latitude, lon: pos.coords.longitude}),
-                    err => resolve(null)
-                );
-            })
-            """,
+            js_expressions=_GPS_JS,
             key="gps_live",
             default=None
         )
@@ -793,33 +885,57 @@ class MapRenderer:
     
     def create_campus_map(self, 
                          user_location: UserLocation,
-                         campus_boundary: List[tuple],
-                         bounds: List[List[float]]) -> folium.Map:
+                         campus_boundary: np.ndarray,
+                         bounds: List[List[float]],
+                         pan_bounds: Optional[List[List[float]]] = None) -> "folium.Map":
         """
         Create a base map centered on user location with campus boundary.
         
         Args:
             user_location: User's GPS coordinates
-            campus_boundary: Campus polygon boundary points
-            bounds: Bounding box for map restrictions
+            campus_boundary: Campus polygon boundary as an (N, 2) lat/lon array
+            bounds: Campus bounding box the initial view is fitted to
+            pan_bounds: Box panning and zooming out are limited to; it must
+                contain everything drawn on the map. Defaults to the campus
+                box widened to include the user (see `pan_extent`)
             
         Returns:
             Configured folium Map object
         """
+        import folium
+        
         tile_layer = MapStyleManager.get_tile_layer(self.map_style)
         attribution = MapStyleManager.get_attribution(self.map_style)
         
-        # Create base map with MUT styling
+        if pan_bounds is None:
+            pan_bounds = self.pan_extent(bounds, [[user_location.lat, user_location.lon]])
+        
+        # Create base map with MUT styling; Leaflet enforces maxBounds from
+        # construction, so panning is held to the drawn area without extra JS
+        (min_lat, min_lon), (max_lat, max_lon) = pan_bounds
         m = folium.Map(
             location=[user_location.lat, user_location.lon],
             zoom_start=Config.DEFAULT_ZOOM,
+            min_zoom=self.min_zoom_for(pan_bounds),
+            max_zoom=Config.MAX_ZOOM,
             tiles=tile_layer,
             attr=attribution,
             control_scale=True,
             max_bounds=True,
+            min_lat=min_lat,
+            max_lat=max_lat,
+            min_lon=min_lon,
+            max_lon=max_lon,
             prefer_canvas=True
         )
         
+        # Markers are CSS-styled DivIcons, so skip the icon font and the
+        # awesome-markers plugin that folium would otherwise fetch from CDNs
+        m.default_css = [(name, url) for name, url in m.default_css
+                         if not name.startswith("awesome")]
+        m.default_js = [(name, url) for name, url in m.default_js
+                        if name != "awesome_markers"]
+        
         # Add campus boundary with MUT colors
         self._add_campus_boundary(m, campus_boundary)
         
@@ -831,33 +947,100 @@ class MapRenderer:
         
         return m
     
+    @staticmethod
+    def pan_extent(bounds: List[List[float]], points: Any) -> List[List[float]]:
+        """
+        Padded box covering the campus and every other point drawn on the map.
+        
+        Args:
+            bounds: Campus bounding box [[min_lat, min_lon], [max_lat, max_lon]]
+            points: (lat, lon) pairs or an (N, 2) array, e.g. the user
+                location, the room and the route path
+            
+        Returns:
+            [[min_lat, min_lon], [max_lat, max_lon]] with
+            Config.PAN_BOUNDS_PADDING of the span added on every side
+        """
+        arr = np.vstack([np.asarray(bounds, dtype=np.float64),
+                         np.asarray(points, dtype=np.float64).reshape(-1, 2)])
+        lo, hi = arr.min(axis=0), arr.max(axis=0)
+        pad = (hi - lo) * Config.PAN_BOUNDS_PADDING
+        return [(lo - pad).tolist(), (hi + pad).tolist()]
+    
+    @staticmethod
+    def min_zoom_for(extent: List[List[float]]) -> int:
+        """
+        Lowest zoom level needed to see the whole extent, capped at Config.MIN_ZOOM.
+        
+        A 256 px tile spans 360 / 2**z degrees, so a map about two tiles
+        across shows 720 / 2**z; one level of slack covers narrow screens.
+        
+        Args:
+            extent: [[min_lat, min_lon], [max_lat, max_lon]]
+            
+        Returns:
+            Minimum zoom level for the map
+        """
+        (min_lat, min_lon), (max_lat, max_lon) = extent
+        span = max(max_lat - min_lat, max_lon - min_lon)
+        if span <= 0:
+            return Config.MIN_ZOOM
+        return max(0, min(Config.MIN_ZOOM, int(math.floor(math.log2(720 / span))) - 1))
+    
+    @staticmethod
+    def overlay(map_obj: "folium.Map") -> "folium.FeatureGroup":
+        """
+        Get the single feature group holding the boundary, markers and route.
+        
+        Grouping the overlays means the map itself gets one layer instead
+        of one per shape. The group is created on first use.
+        
+        Args:
+            map_obj: Folium map object the overlays belong to
+            
+        Returns:
+            The map's overlay FeatureGroup
+        """
+        import folium
+        
+        group = getattr(map_obj, "_mut_overlay", None)
+        if group is None:
+            group = folium.FeatureGroup(name="mut_overlay", control=False)
+            group.add_to(map_obj)
+            map_obj._mut_overlay = group
+        return group
+    
     def _add_campus_boundary(self, 
-                           map_obj: folium.Map, 
-                           boundary: List[tuple]) -> None:
+                           map_obj: "folium.Map", 
+                           boundary: np.ndarray) -> None:
         """
         Add campus boundary polygon with MUT branding colors.
         
         Args:
             map_obj: Folium map object to add boundary to
-            boundary: List of (lat, lon) tuples defining boundary
+            boundary: (N, 2) array of (lat, lon) rows defining boundary
         """
+        import folium
+        
         folium.Polygon(
-            locations=[(lat, lon) for lat, lon in boundary],
+            locations=boundary.tolist(),
             color=MUTTheme.PRIMARY_RED,
             weight=3,
             fill=True,
             fill_color=MUTTheme.PRIMARY_GREEN,
             fill_opacity=0.2,
             tooltip="🏫 MUT Campus Boundary"
-        ).add_to(map_obj)
+        ).add_to(self.overlay(map_obj))
     
-    def _add_map_styling(self, map_obj: folium.Map) -> None:
+    def _add_map_styling(self, map_obj: "folium.Map") -> None:
         """
         Add custom CSS styling to the map.
         
         Args:
             map_obj: Folium map object to style
         """
+        from branca.element import Element
+        
         custom_css = """
         <style>
         .leaflet-container {
@@ -871,13 +1054,29 @@ class MapRenderer:
         .leaflet-popup-tip {
             background: white;
         }
+        .mut-pin {
+            width: 100%;
+            height: 100%;
+            box-sizing: border-box;
+            border: 3px solid white;
+            box-shadow: 0 2px 6px rgba(0,0,0,0.35);
+        }
+        .mut-pin-user {
+            background: #2196F3;
+            border-radius: 50%;
+        }
+        .mut-pin-room {
+            background: #D32F2F;
+            border-radius: 50% 50% 50% 0;
+            transform: rotate(-45deg);
+        }
         </style>
         """
         
         map_obj.get_root().html.add_child(Element(custom_css))
     
     def add_markers(self, 
-                   map_obj: folium.Map,
+                   map_obj: "folium.Map",
                    user_location: UserLocation,
                    room: Room) -> None:
         """
@@ -888,17 +1087,15 @@ class MapRenderer:
             user_location: User's GPS coordinates
             room: Room object with location information
         """
+        import folium
+        
         # User location marker with MUT blue styling
         folium.Marker(
             [user_location.lat, user_location.lon],
             tooltip="📍 You are here",
             popup=folium.Popup("Your current location", max_width=200),
-            icon=folium.Icon(
-                color="blue", 
-                icon="user", 
-                prefix="fa"
-            )
-        ).add_to(map_obj)
+            icon=self.pin_icon("user")
+        ).add_to(self.overlay(map_obj))
         
         # Room location marker with MUT red styling
         if room.lat and room.lon:
@@ -906,24 +1103,53 @@ class MapRenderer:
                 [room.lat, room.lon],
                 tooltip=f"🎯 {room.room_name}",
                 popup=folium.Popup(
-                    f"""
-                    <div style="font-family: Inter, sans-serif; text-align: center; padding: 10px;">
-                        <h4 style="margin: 0 0 10px 0; color: #D32F2F;">🎯 {room.room_name}</h4>
-                        <p style="margin: 0; color: #666;"><strong>Building:</strong> {room.building}</p>
-                        <p style="margin: 0; color: #666;"><strong>Floor:</strong> {room.floor}</p>
-                    </div>
-                    """,
+                    self._room_popup_html(room.room_name, room.building, room.floor),
                     max_width=250
                 ),
-                icon=folium.Icon(
-                    color="red", 
-                    icon="map-marker", 
-                    prefix="fa"
-                )
-            ).add_to(map_obj)
+                icon=self.pin_icon("room")
+            ).add_to(self.overlay(map_obj))
+    
+    @staticmethod
+    def pin_icon(kind: str) -> "folium.DivIcon":
+        """
+        Create a CSS-only marker icon styled by `_add_map_styling`.
+        
+        Args:
+            kind: "user" for the round location dot, "room" for the red pin
+            
+        Returns:
+            DivIcon anchored at the dot centre or the pin tip
+        """
+        import folium
+        
+        if kind == "user":
+            return folium.DivIcon(
+                html='<div class="mut-pin mut-pin-user"></div>',
+                icon_size=(22, 22),
+                icon_anchor=(11, 11)
+            )
+        
+        return folium.DivIcon(
+            html='<div class="mut-pin mut-pin-room"></div>',
+            icon_size=(28, 28),
+            icon_anchor=(14, 34),
+            popup_anchor=(0, -30)
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _room_popup_html(room_name: str, building: str, floor: str) -> str:
+        """Room marker popup markup, memoized per room."""
+        return f"""
+                    <div style="font-family: Inter, sans-serif; text-align: center; padding: 10px;">
+                        <h4 style="margin: 0 0 10px 0; color: #D32F2F;">🎯 {room_name}</h4>
+                        <p style="margin: 0; color: #666;"><strong>Building:</strong> {building}</p>
+                        <p style="margin: 0; color: #666;"><strong>Floor:</strong> {floor}</p>
+                    </div>
+                    """
     
     def add_route(self, 
-                 map_obj: folium.Map,
+                 map_obj: "folium.Map",
                  route: RouteInfo) -> None:
         """
         Add walking route with MUT-styled colors.
@@ -932,6 +1158,22 @@ class MapRenderer:
             map_obj: Folium map object to add route to
             route: RouteInfo object containing route geometry
         """
+        import folium
+        
+        if len(route.path):
+            # A plain Leaflet polyline is much lighter than a GeoJson layer;
+            # near-collinear OSRM vertices are dropped before serializing
+            path = GeometryUtils.simplify_polygon(route.path, Config.ROUTE_SIMPLIFY_TOLERANCE)
+            folium.PolyLine(
+                locations=np.round(path, Config.DISPLAY_COORD_DECIMALS).tolist(),
+                color=MUTTheme.PRIMARY_GREEN,
+                weight=5,
+                opacity=0.8,
+                dash_array="10, 5",
+                tooltip="🚶 Walking Route to Destination"
+            ).add_to(self.overlay(map_obj))
+            return
+        
         folium.GeoJson(
             route.geometry,
             style_function=lambda x: {
@@ -941,7 +1183,135 @@ class MapRenderer:
                 "dashArray": "10, 5"
             },
             tooltip="🚶 Walking Route to Destination"
-        ).add_to(map_obj)
+        ).add_to(self.overlay(map_obj))
+
+
+@st.cache_data(show_spinner=False)
+def _simplified_boundary(campus_boundary: np.ndarray) -> np.ndarray:
+    """Simplified, display-rounded copy of the boundary, used for drawing only."""
+    simplified = GeometryUtils.simplify_polygon(
+        campus_boundary, Config.CAMPUS_BOUNDARY_SIMPLIFY_TOLERANCE
+    )
+    return np.round(simplified, Config.DISPLAY_COORD_DECIMALS)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_campus_map(map_style: str,
+                      user_lat: float, user_lon: float,
+                      campus_boundary: np.ndarray,
+                      bounds: List[List[float]],
+                      room: Optional[Room] = None,
+                      route: Optional[RouteInfo] = None) -> str:
+    """
+    Build and render the complete campus map for one set of inputs.
+    
+    Cached on every argument, so reruns that change nothing on the map reuse
+    the finished HTML and skip both map construction and folium's template
+    rendering.
+    
+    Args:
+        map_style: Map tile style name
+        user_lat: User latitude (rounded by the caller)
+        user_lon: User longitude (rounded by the caller)
+        campus_boundary: (N, 2) array of (lat, lon) rows defining the campus
+        bounds: Bounding box for map restrictions
+        room: Selected room, or None for the campus overview
+        route: Walking route to the room, if one was found
+        
+    Returns:
+        Standalone HTML document for the map
+    """
+    import folium
+    
+    user_location = UserLocation(lat=user_lat, lon=user_lon)
+    map_renderer = MapRenderer(map_style)
+    
+    # Panning must reach everything drawn, which may lie well off campus
+    drawn = [[user_lat, user_lon]]
+    if room is not None:
+        drawn.append([room.lat, room.lon])
+    if route is not None and len(route.path):
+        drawn.extend(route.path.tolist())
+    pan_bounds = MapRenderer.pan_extent(bounds, drawn)
+    
+    campus_map = map_renderer.create_campus_map(
+        user_location, campus_boundary, bounds, pan_bounds
+    )
+    
+    if room is None:
+        # Add only user marker
+        folium.Marker(
+            [user_location.lat, user_location.lon],
+            tooltip="📍 You are here",
+            icon=MapRenderer.pin_icon("user")
+        ).add_to(MapRenderer.overlay(campus_map))
+    else:
+        map_renderer.add_markers(campus_map, user_location, room)
+        if route:
+            map_renderer.add_route(campus_map, route)
+    
+    return campus_map.get_root().render()
+
+
+class _RouteUnavailable(Exception):
+    """Raised inside the cached route lookup so that failures are not cached."""
+
+
+@st.cache_data(ttl=Config.ROUTE_CACHE_TTL, max_entries=512, show_spinner=False)
+def _cached_route(from_lat: float, from_lon: float,
+                  to_lat: float, to_lon: float) -> RouteInfo:
+    """Walking route between two rounded points, shared across reruns and sessions."""
+    route = RouteCalculator.get_walking_route(
+        from_lat, from_lon, to_lat, to_lon,
+        timeout=Config.ROUTE_TIMEOUT
+    )
+    if route is None:
+        raise _RouteUnavailable()
+    return route
+
+
+def _get_route(user_location: UserLocation, room: Room) -> Optional[RouteInfo]:
+    """
+    Walking route from the user to a room, looked up once per location pair.
+    
+    The search and map sections both need the route; going through one
+    cached helper means a single OSRM request serves both.
+    
+    Args:
+        user_location: User's GPS coordinates
+        room: Destination room
+        
+    Returns:
+        RouteInfo object, or None if no route could be calculated
+    """
+    try:
+        return _cached_route(
+            round(user_location.lat, 5), round(user_location.lon, 5),
+            round(room.lat, 5), round(room.lon, 5)
+        )
+    except _RouteUnavailable:
+        return None
+
+
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def _cached_search(_search_engine: RoomSearchEngine,
+                   engine_fingerprint: int,
+                   query: str) -> List[Room]:
+    """Substring and fuzzy search results, computed once per distinct query."""
+    return _search_engine.search(query)
+
+
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def _cached_suggestions(_search_engine: RoomSearchEngine,
+                        engine_fingerprint: int,
+                        query: str) -> List[str]:
+    """
+    Fuzzy suggestions for a query, computed once per distinct query.
+    
+    The engine itself is not hashed (leading underscore); its fingerprint
+    stands in for it in the cache key.
+    """
+    return _search_engine.get_fuzzy_suggestions(query)
 
 
 class SearchInterface:
@@ -960,20 +1330,23 @@ class SearchInterface:
         """
         Render modern search input field with styling.
         
+        The input sits in a form, so the search only reruns when the query
+        is submitted (Enter or the Search button), not when the field loses
+        focus mid-edit.
+        
         Returns:
-            Current search query string
+            Last submitted search query string
         """
-        UIComponents.render_search_container()
-        
-        # Custom search input with placeholder
-        search_query = st.text_input(
-            "",
-            placeholder="🔍 Search for rooms, buildings, labs...",
-            help="Try searching for room numbers like 'A101' or building names like 'Library'",
-            key="room_search"
-        )
-        
-        UIComponents.close_search_container()
+        with UIComponents.search_container():
+            with st.form("search_form", border=False):
+                # Custom search input with placeholder
+                search_query = st.text_input(
+                    "",
+                    placeholder="🔍 Search for rooms, buildings, labs...",
+                    help="Try searching for room numbers like 'A101' or building names like 'Library'",
+                    key="room_search"
+                )
+                st.form_submit_button("Search", use_container_width=True)
         
         return search_query
     
@@ -991,8 +1364,12 @@ class SearchInterface:
             return self._render_popular_rooms()
         
         # Get filtered rooms and suggestions
-        filtered_rooms = self.search_engine.search(query)
-        suggestions = self.search_engine.get_fuzzy_suggestions(query)
+        filtered_rooms = _cached_search(
+            self.search_engine, self.search_engine.fingerprint, query
+        )
+        suggestions = _cached_suggestions(
+            self.search_engine, self.search_engine.fingerprint, query
+        )
         
         # Show suggestions as modern buttons
         selected_room = UIComponents.render_suggestions(suggestions[:6])
@@ -1058,17 +1435,65 @@ class SearchInterface:
         Returns:
             Selected room name, or None if no selection
         """
-        all_room_names = sorted(list(set(room.room_name for room in self.search_engine.rooms)))
-        
         selected = st.selectbox(
             "📋 Or select from all rooms:",
-            [""] + all_room_names,
+            [""] + self.search_engine.unique_room_names,
             format_func=lambda x: "Browse all rooms..." if x == "" else f"🏢 {x}"
         )
         
         return selected if selected else None
 
 
+@st.cache_resource(show_spinner=False)
+def _get_rooms(rooms_file: str) -> Tuple[Room, ...]:
+    """
+    Rooms loaded once per process and shared by every session and rerun.
+    
+    Returned as a tuple of frozen rooms, so no session can change the shared
+    copy in place.
+    """
+    return tuple(DataLoader.load_rooms(rooms_file))
+
+
+@st.cache_resource(show_spinner=False)
+def _load_boundary_and_bounds(boundaries_file: str) -> Tuple[np.ndarray, List[List[float]]]:
+    """
+    Campus boundary and its map bounds, computed together once per process.
+    
+    Returns:
+        Tuple of the (N, 2) boundary array and [[min_lat, min_lon],
+        [max_lat, max_lon]], falling back to default Kenya bounds when the
+        boundary is empty
+    """
+    boundary = DataLoader.load_campus_boundary(boundaries_file)
+    # Shared by every session, so guard the array against in-place edits
+    boundary.setflags(write=False)
+    
+    if len(boundary):
+        bounds = GeometryUtils.calculate_bounding_box(boundary)
+    else:
+        bounds = [[-1.0, 36.0], [0.0, 38.0]]  # Default Kenya bounds
+    
+    return boundary, bounds
+
+
+@st.cache_resource(show_spinner=False)
+def _get_search_engine(rooms_file: str) -> RoomSearchEngine:
+    """
+    Search engine over the cached rooms, built once per rooms file.
+    
+    Keyed by path rather than by the room list so the cache key stays cheap
+    to hash on every rerun.
+    """
+    return RoomSearchEngine(_get_rooms(rooms_file))
+
+
+@st.cache_resource(show_spinner=False)
+def _get_access_controller(boundaries_file: str) -> AccessController:
+    """Access controller over the cached boundary, built once per file."""
+    return AccessController(_load_boundary_and_bounds(boundaries_file)[0])
+
+
 class CampusRoomFinderApp:
     """Main application class with modern mobile-first UI."""
     
@@ -1082,8 +1507,8 @@ class CampusRoomFinderApp:
             initial_sidebar_state="collapsed"
         )
         
-        # Apply custom CSS styling
-        st.markdown(MUTTheme.get_custom_css(), unsafe_allow_html=True)
+        # Apply custom CSS styling and render the header in one element
+        UIComponents.render_header()
         
         # Initialize session state for mobile navigation
         if 'current_section' not in st.session_state:
@@ -1095,31 +1520,25 @@ class CampusRoomFinderApp:
         if 'user_location' not in st.session_state:
             st.session_state.user_location = None
         
-        # Load data
+        # Load data and build components (cached across reruns and sessions)
         try:
-            self.rooms = DataLoader.load_rooms(Config.ROOMS_FILE)
-            self.campus_boundary = DataLoader.load_campus_boundary(Config.BOUNDARIES_FILE)
+            self.rooms = _get_rooms(Config.ROOMS_FILE)
+            self.campus_boundary, self.campus_bounds = _load_boundary_and_bounds(
+                Config.BOUNDARIES_FILE
+            )
+            self.search_engine = _get_search_engine(Config.ROOMS_FILE)
+            self.access_controller = _get_access_controller(Config.BOUNDARIES_FILE)
         except Exception as e:
             st.error(f"❌ Error loading data: {str(e)}")
             st.stop()
         
-        # Initialize components
-        self.search_engine = RoomSearchEngine(self.rooms)
-        self.access_controller = AccessController(self.campus_boundary)
-        
-        # Calculate campus bounds for map restrictions
-        if self.campus_boundary:
-            self.campus_bounds = GeometryUtils.calculate_bounding_box(self.campus_boundary)
-        else:
-            self.campus_bounds = [[-1.0, 36.0], [0.0, 38.0]]  # Default Kenya bounds
+        # Fewer vertices for the drawn outline; access checks keep the full one
+        self.display_boundary = _simplified_boundary(self.campus_boundary)
     
     def run(self) -> None:
         """Run the main application with modern mobile-first UI."""
-        # Render header
-        UIComponents.render_header()
-        
         # Check if boundary data is available
-        if not self.campus_boundary:
+        if len(self.campus_boundary) == 0:
             st.error("❌ Campus boundary data not found. Please contact the administrator.")
             st.info("📄 Required file: `campus-room-finder/boundaries.csv`")
             st.stop()
@@ -1134,12 +1553,21 @@ class CampusRoomFinderApp:
         """
         Handle GPS acquisition and access control with user-friendly messages.
         
+        Once a GPS fix is obtained it is kept for the session, so later reruns
+        skip the browser geolocation round-trip until the user asks to refresh.
+        
         Returns:
             UserLocation object (with fallback to campus center)
         """
-        # Show GPS status
-        with st.spinner("📍 Getting your location..."):
-            user_location = GPSManager.get_user_location()
+        user_location = st.session_state.get('gps_fix')
+        
+        if user_location is None:
+            # Show GPS status
+            with st.spinner("📍 Getting your location..."):
+                user_location = GPSManager.get_user_location()
+            
+            if user_location:
+                st.session_state.gps_fix = user_location
         
         if user_location:
             # Validate location access
@@ -1157,6 +1585,12 @@ class CampusRoomFinderApp:
                     "✅ Location detected successfully!",
                     "success"
                 )
+            
+            st.button(
+                "🔄 Refresh location",
+                key="refresh_gps",
+                on_click=lambda: st.session_state.pop('gps_fix', None)
+            )
         else:
             UIComponents.render_status_message(
                 "📍 Using campus center as your starting location",
@@ -1168,21 +1602,28 @@ class CampusRoomFinderApp:
         st.session_state.user_location = user_location
         return user_location
     
+    @st.fragment
     def _render_main_interface(self, user_location: UserLocation) -> None:
         """
         Render the main application interface with responsive design.
         
+        Runs as a fragment, so search, suggestion and map-style interactions
+        rerun only this block instead of the header, styles and GPS check.
+        
         Args:
             user_location: User's GPS coordinates
         """
+        # Routes looked up during this run, including failures, so the
+        # search and map sections never repeat a lookup within one run
+        self._run_routes: Dict[Tuple[float, float, float, float], Optional[RouteInfo]] = {}
+        
         # Map style selector
-        UIComponents.render_map_style_container()
-        map_style = st.selectbox(
-            "🗺️ Choose Map Style:",
-            list(MapStyleManager.TILE_LAYERS.keys()),
-            help="Select your preferred map visualization style"
-        )
-        UIComponents.close_map_style_container()
+        with UIComponents.map_style_container():
+            map_style = st.selectbox(
+                "🗺️ Choose Map Style:",
+                list(MapStyleManager.TILE_LAYERS.keys()),
+                help="Select your preferred map visualization style"
+            )
         
         # Create responsive layout
         col1, col2 = st.columns([1, 2])
@@ -1205,10 +1646,7 @@ class CampusRoomFinderApp:
         
         if selected_room_name:
             # Find the room object
-            selected_room = next(
-                (room for room in self.rooms if room.room_name == selected_room_name), 
-                None
-            )
+            selected_room = self.search_engine.get_room(selected_room_name)
             
             if selected_room:
                 st.session_state.selected_room = selected_room
@@ -1257,11 +1695,7 @@ class CampusRoomFinderApp:
         )
         
         # Calculate route
-        route = RouteCalculator.get_walking_route(
-            user_location.lat, user_location.lon,
-            room.lat, room.lon,
-            timeout=Config.ROUTE_TIMEOUT
-        )
+        route = self._route_to(user_location, room)
         
         if route:
             UIComponents.render_status_message(
@@ -1275,6 +1709,27 @@ class CampusRoomFinderApp:
                 "error"
             )
     
+    def _route_to(self, user_location: UserLocation, room: Room) -> Optional[RouteInfo]:
+        """
+        Walking route to a room, looked up at most once per run.
+        
+        Successful routes are also shared across runs by _get_route's cache;
+        failures are not cached there, so this keeps a failed lookup from
+        being retried by the second section in the same run.
+        
+        Args:
+            user_location: User's GPS coordinates
+            room: Destination room
+            
+        Returns:
+            RouteInfo object, or None if no route could be calculated
+        """
+        key = (round(user_location.lat, 5), round(user_location.lon, 5),
+               round(room.lat, 5), round(room.lon, 5))
+        if key not in self._run_routes:
+            self._run_routes[key] = _get_route(user_location, room)
+        return self._run_routes[key]
+    
     def _render_map_section(self, user_location: UserLocation, map_style: str) -> None:
         """
         Render the interactive map section.
@@ -1286,47 +1741,28 @@ class CampusRoomFinderApp:
         selected_room = st.session_state.get('selected_room')
         
         if selected_room and selected_room.lat and selected_room.lon:
-            # Create and configure map
-            map_renderer = MapRenderer(map_style)
-            campus_map = map_renderer.create_campus_map(
-                user_location, 
-                self.campus_boundary, 
-                self.campus_bounds
-            )
+            # Add route if available (same lookup as the search section)
+            route = self._route_to(user_location, selected_room)
             
-            # Add markers
-            map_renderer.add_markers(campus_map, user_location, selected_room)
-            
-            # Add route if available
-            route = RouteCalculator.get_walking_route(
-                user_location.lat, user_location.lon,
-                selected_room.lat, selected_room.lon,
-                timeout=Config.ROUTE_TIMEOUT
+            map_html = _build_campus_map(
+                map_style,
+                round(user_location.lat, 5), round(user_location.lon, 5),
+                self.display_boundary, self.campus_bounds,
+                selected_room, route
             )
             
-            if route:
-                map_renderer.add_route(campus_map, route)
-            
             # Display the map
-            st_folium(campus_map, width=None, height=500, returned_objects=[])
+            st.iframe(map_html, height=500)
             
         else:
             # Show campus overview map
-            map_renderer = MapRenderer(map_style)
-            campus_map = map_renderer.create_campus_map(
-                user_location, 
-                self.campus_boundary, 
-                self.campus_bounds
+            map_html = _build_campus_map(
+                map_style,
+                round(user_location.lat, 5), round(user_location.lon, 5),
+                self.display_boundary, self.campus_bounds
             )
             
-            # Add only user marker
-            folium.Marker(
-                [user_location.lat, user_location.lon],
-                tooltip="📍 You are here",
-                icon=folium.Icon(color="blue", icon="user", prefix="fa")
-            ).add_to(campus_map)
-            
-            st_folium(campus_map, width=None, height=500, returned_objects=[])
+            st.iframe(map_html, height=500)
             
             st.markdown(
                 """